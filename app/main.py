@@ -5,9 +5,11 @@ An agentic honeypot system for detecting and analyzing security threats.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import config
 from app.models.schemas import HealthCheckResponse
 from app.routes import honeypot
+from app.services.authority_fetcher import AuthorityFetcher
 
 # Validate configuration on startup
 try:
@@ -22,7 +24,8 @@ app = FastAPI(
     version=config.APP_VERSION,
     description="Agentic honeypot system for security threat detection and analysis",
     docs_url="/docs",  # Swagger UI available at /docs
-    redoc_url="/redoc"  # ReDoc available at /redoc
+    redoc_url="/redoc",  # ReDoc available at /redoc
+    default_response_class=ORJSONResponse  # orjson serialization for every route
 )
 
 # Configure CORS (adjust for production as needed)
@@ -62,6 +65,7 @@ async def health_check():
 @app.on_event("startup")
 async def startup_event():
     """Actions to perform on application startup"""
+    AuthorityFetcher.open_async_client()
     print(f"🚀 Starting {config.APP_NAME} v{config.APP_VERSION}")
     print(f"📝 API Documentation available at http://{config.HOST}:{config.PORT}/docs")
 
@@ -70,6 +74,7 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Actions to perform on application shutdown"""
+    await AuthorityFetcher.close_async_client()
     print(f"👋 Shutting down {config.APP_NAME}")
 
 
@@ -1,12 +1,16 @@
 """
 Additional honeypot API implementing PRD-style request/response.
-Uses the comprehensive ScamDetector service for Phase 1 detection.
+Uses the comprehensive scam detector service for Phase 1 detection.
 """
-from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
-from fastapi import APIRouter, Depends
+import json
+from typing import Any, Optional, List, Dict, Type, Union
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from app.config import config
 from app.middleware.auth import verify_api_key
-from app.services.scam_detector import ScamDetector
+from app.services.scam_detector import detect_async
 
 router = APIRouter(prefix="/api/honeypot", tags=["honeypot_api"], dependencies=[Depends(verify_api_key)])
 
@@ -24,6 +28,96 @@ class HoneypotMessageRequest(BaseModel):
     metadata: Optional[Dict[str, str]] = Field(default=None)
 
 
+# Phase 1 only reads message.text; validate just that path and ignore the rest
+class _MessageText(BaseModel):
+    text: str
+
+
+class _MessagePayload(BaseModel):
+    message: _MessageText
+
+
+# Documentation only: the request contract enforced outside DEBUG
+class _RelaxedHistoryMessage(BaseModel):
+    model_config = ConfigDict(title="Message")
+
+    sender: Optional[str] = Field(None, description="scammer | user")
+    text: Optional[str] = Field(None, description="message text")
+    timestamp: Optional[int] = Field(None)
+
+
+class _RelaxedMessage(_RelaxedHistoryMessage):
+    text: str = Field(..., description="message text")
+
+
+class _RelaxedMessageRequest(BaseModel):
+    """Only message.text is required; other fields are accepted but not validated."""
+    model_config = ConfigDict(title="HoneypotMessageRequest")
+
+    sessionId: Optional[str] = Field(None)
+    message: _RelaxedMessage = Field(...)
+    conversationHistory: Optional[List[_RelaxedHistoryMessage]] = Field(default_factory=list)
+    metadata: Optional[Dict[str, str]] = Field(default=None)
+
+
+def _request_body_schema() -> Dict[str, Any]:
+    """Request JSON schema with $defs inlined, for the OpenAPI docs.
+
+    DEBUG validates the full HoneypotMessageRequest; otherwise only
+    message.text is checked, which _RelaxedMessageRequest documents.
+    """
+    model = HoneypotMessageRequest if config.DEBUG else _RelaxedMessageRequest
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return inline(schema)
+
+
+def _is_json(content_type: Optional[str]) -> bool:
+    """Same rule FastAPI applies before parsing a body as JSON."""
+    if not content_type:
+        return True
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type == "application/json" or (media_type.startswith("application/") and media_type.endswith("+json"))
+
+
+def _message_text_like_fastapi(
+    body: bytes, model: Type[Union[_MessagePayload, HoneypotMessageRequest]], is_json: bool
+) -> str:
+    """Parse the body the way FastAPI's own body handling does.
+
+    Only reached when the fast path rejects a request, so the 422 keeps
+    FastAPI's error shapes without re-parsing valid traffic.
+    """
+    payload: Any = body or None
+    if is_json and body:
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise RequestValidationError(
+                [{"type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error", "input": {}, "ctx": {"error": e.msg}}],
+                body=e.doc
+            )
+    if payload is None:
+        raise RequestValidationError([{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}])
+    try:
+        return model.model_validate(payload, from_attributes=True).message.text
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=payload
+        )
+
+
 class AuthorityProfile(BaseModel):
     """Represents a single bank/government authority context."""
     name: str
@@ -54,13 +148,31 @@ class HoneypotMessageResponse(BaseModel):
     extractedIntelligence: ExtractedIntelligence
 
 
-@router.post("/message", response_model=HoneypotMessageResponse)
-async def process_message(request: HoneypotMessageRequest):
+# The request body is parsed by hand and the response serialized directly;
+# HoneypotMessageRequest/HoneypotMessageResponse only document the contract
+@router.post(
+    "/message",
+    response_model=None,
+    responses={200: {"model": HoneypotMessageResponse}},
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {"schema": _request_body_schema()}}}}
+)
+async def process_message(request: Request):
     """PRD Phase 1 + Phase 2 honeypot endpoint."""
-    text = request.message.text
+    body = await request.body()
+    # DEBUG runs full validation, including conversation history and metadata
+    model = HoneypotMessageRequest if config.DEBUG else _MessagePayload
+    is_json = _is_json(request.headers.get("content-type"))
+    text = None
+    if is_json:
+        try:
+            text = model.model_validate_json(body).message.text
+        except ValidationError:
+            pass
+    if text is None:
+        text = _message_text_like_fastapi(body, model, is_json)
     
     # Phase 1: Scam detection with rule validation
-    scamDetected, scamType, scamScore, extracted = ScamDetector.detect(text)
+    scamDetected, scamType, scamScore, extracted = await detect_async(text)
 
     # Phase 2: Generate persona-guided agent reply
     if scamDetected:
@@ -68,25 +180,12 @@ async def process_message(request: HoneypotMessageRequest):
     else:
         reply = "Thanks for your message — can you tell me more?"
 
-    # Convert extracted dict to ExtractedIntelligence model
-    authority_profile = None
-    if extracted.get("authorityProfile"):
-        authority_profile = AuthorityProfile(**extracted["authorityProfile"])
-
-    intelligence = ExtractedIntelligence(
-        upiIds=extracted.get("upiIds", []),
-        phoneNumbers=extracted.get("phoneNumbers", []),
-        phishingLinks=extracted.get("phishingLinks", []),
-        bankAccounts=extracted.get("bankAccounts", []),
-        suspiciousKeywords=extracted.get("suspiciousKeywords", []),
-        authorityProfile=authority_profile
-    )
-
-    return HoneypotMessageResponse(
-        status="success",
-        reply=reply,
-        scamDetected=scamDetected,
-        scamType=scamType,
-        scamScore=scamScore,
-        extractedIntelligence=intelligence
-    )
+    # The extracted dict already has the ExtractedIntelligence shape
+    return ORJSONResponse({
+        "status": "success",
+        "reply": reply,
+        "scamDetected": scamDetected,
+        "scamType": scamType,
+        "scamScore": scamScore,
+        "extractedIntelligence": extracted
+    })
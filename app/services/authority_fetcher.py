@@ -1,8 +1,20 @@
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from dataclasses import dataclass, asdict, replace
+from typing import Any, List, Dict, Optional, Tuple
+import asyncio
 import time
 import threading
-import requests
+import httpx
+
+# Shared clients for discovery probes: pooled keep-alive HTTP/2 connections
+# amortize the TCP+TLS handshake across probes
+_HTTP_OPTIONS: Dict[str, Any] = dict(
+    http2=True,
+    timeout=3.0,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=32),
+    headers={"User-Agent": "rakshakai-probe/1.0"},
+)
+_HTTP = httpx.Client(**_HTTP_OPTIONS)
 
 
 @dataclass
@@ -15,6 +27,11 @@ class AuthorityProfile:
     never_requests: List[str]
     last_refreshed: float = 0.0
 
+    def __post_init__(self):
+        # Rule literals are matched against lowercased message text
+        self.never_asks = [s.lower() for s in self.never_asks]
+        self.never_requests = [s.lower() for s in self.never_requests]
+
 
 class AuthorityFetcher:
     """Simple in-memory authority profile fetcher with TTL and seeded profiles.
@@ -23,10 +40,21 @@ class AuthorityFetcher:
     fetch live pages for verification and to refresh cached entries.
     """
 
-    _cache: Dict[str, AuthorityProfile] = {}
+    # key -> (profile, fetched_at). Entries are replaced, never mutated, so reads
+    # need no lock (dict get/set/pop are atomic under the GIL); writers take _lock.
+    _cache: Dict[str, Tuple[AuthorityProfile, float]] = {}
     _lock = threading.Lock()
     _ttl_seconds = 6 * 60 * 60  # 6 hours by default
 
+    # key -> time of the last discovery that got only non-200 answers, so unknown
+    # names are not re-probed
+    _negative_cache: Dict[str, float] = {}
+    _negative_ttl_seconds = 15 * 60  # 15 minutes
+
+    # The async pool is bound to the event loop it first runs on, so the app
+    # opens and closes it in its startup/shutdown hooks (see open_async_client)
+    _async_http: Optional[httpx.AsyncClient] = None
+
     # Seeded profiles for common authorities
     _seeded: Dict[str, AuthorityProfile] = {
         "SBI": AuthorityProfile(
@@ -68,49 +96,137 @@ class AuthorityFetcher:
         if not name:
             return None
         key = name.strip().upper()
-        with cls._lock:
-            # Return cached and fresh
-            existing = cls._cache.get(key)
-            if existing and (time.time() - existing.last_refreshed) < cls._ttl_seconds:
-                return existing
+        profile = cls._cached_or_seeded(key)
+        if profile or cls._recently_missed(key):
+            return profile
+
+        # Fallback: attempt lightweight discovery (best-effort)
+        return cls._store_discovered(key, *cls._discover_profile(key))
+
+    @classmethod
+    async def get_profile_async(cls, name: str) -> Optional[AuthorityProfile]:
+        """Same as get_profile, but discovery probes run concurrently without blocking the event loop."""
+        if not name:
+            return None
+        key = name.strip().upper()
+        profile = cls._cached_or_seeded(key)
+        if profile or cls._recently_missed(key):
+            return profile
+
+        return cls._store_discovered(key, *await cls._discover_profile_async(key))
+
+    @classmethod
+    def _cached_or_seeded(cls, key: str) -> Optional[AuthorityProfile]:
+        # Return cached and fresh (lock-free)
+        existing = cls._cache.get(key)
+        if existing and (time.time() - existing[1]) < cls._ttl_seconds:
+            return existing[0]
 
         # Try seeded
         seed = cls._seeded.get(key)
         if seed:
-            seed.last_refreshed = time.time()
+            # Cache a stamped copy; the shared seed itself is never mutated
+            now = time.time()
+            profile = replace(seed, last_refreshed=now)
             with cls._lock:
-                cls._cache[key] = seed
-            return seed
+                cls._cache[key] = (profile, now)
+            return profile
+        return None
 
-        # Fallback: attempt lightweight discovery (best-effort)
-        profile = cls._discover_profile(key)
-        if profile:
-            profile.last_refreshed = time.time()
-            with cls._lock:
-                cls._cache[key] = profile
-        return profile
+    @classmethod
+    def _recently_missed(cls, key: str) -> bool:
+        missed_at = cls._negative_cache.get(key)
+        return missed_at is not None and (time.time() - missed_at) < cls._negative_ttl_seconds
 
     @classmethod
-    def _discover_profile(cls, key: str) -> Optional[AuthorityProfile]:
+    def _store_discovered(
+        cls, key: str, profile: Optional[AuthorityProfile], answered: bool
+    ) -> Optional[AuthorityProfile]:
+        now = time.time()
+        with cls._lock:
+            if profile:
+                profile.last_refreshed = now
+                cls._cache[key] = (profile, now)
+                cls._negative_cache.pop(key, None)
+            elif answered:
+                # Only a real non-200 answer is remembered; network errors are
+                # retried on the next lookup
+                cls._negative_cache[key] = now
+        return profile
+
+    @staticmethod
+    def _candidate_domains(key: str) -> List[str]:
         # Very lightweight heuristic: try common domain patterns
-        try_domains = [f"{key.lower()}.com", f"{key.lower()}.co.in", f"{key.lower()}.org"]
-        for d in try_domains:
+        return [f"{key.lower()}.com", f"{key.lower()}.co.in", f"{key.lower()}.org"]
+
+    @staticmethod
+    def _discovered_profile(key: str, domain: str) -> AuthorityProfile:
+        # Create a minimal profile
+        return AuthorityProfile(
+            name=key,
+            type="BANK" if any(k in key for k in ["BANK", "SBI", "HDFC", "ICICI"]) else "GOVT",
+            official_domains=[domain],
+            official_channels=["WEBSITE"],
+            never_asks=["otp", "password"],
+            never_requests=[]
+        )
+
+    @classmethod
+    def _discover_profile(cls, key: str) -> Tuple[Optional[AuthorityProfile], bool]:
+        """Returns (profile, answered); answered is False when every probe raised."""
+        answered = False
+        for d in cls._candidate_domains(key):
             try:
-                url = f"https://{d}"
-                r = requests.get(url, timeout=3)
-                if r.status_code == 200:
-                    # Create a minimal profile
-                    return AuthorityProfile(
-                        name=key,
-                        type="BANK" if any(k in key for k in ["BANK", "SBI", "HDFC", "ICICI"]) else "GOVT",
-                        official_domains=[d],
-                        official_channels=["WEBSITE"],
-                        never_asks=["otp", "password"],
-                        never_requests=[]
-                    )
+                # HEAD skips the body download
+                r = _HTTP.head(f"https://{d}")
             except Exception:
                 continue
-        return None
+            answered = True
+            if r.status_code == 200:
+                return cls._discovered_profile(key, d), True
+        return None, answered
+
+    @classmethod
+    async def _discover_profile_async(cls, key: str) -> Tuple[Optional[AuthorityProfile], bool]:
+        client = cls._async_http
+        if client is None:
+            # Outside the app lifecycle (scripts, tests): use a short-lived client
+            async with httpx.AsyncClient(**_HTTP_OPTIONS) as client:
+                return await cls._probe_async(client, key)
+        return await cls._probe_async(client, key)
+
+    @classmethod
+    async def _probe_async(
+        cls, client: httpx.AsyncClient, key: str
+    ) -> Tuple[Optional[AuthorityProfile], bool]:
+        # Probe all candidate domains at once; HEAD skips the body download
+        try_domains = cls._candidate_domains(key)
+        results = await asyncio.gather(
+            *(client.head(f"https://{d}") for d in try_domains),
+            return_exceptions=True
+        )
+        # Keep the candidate order as the preference order
+        answered = False
+        for d, r in zip(try_domains, results):
+            if isinstance(r, BaseException):
+                continue
+            answered = True
+            if r.status_code == 200:
+                return cls._discovered_profile(key, d), True
+        return None, answered
+
+    @classmethod
+    def open_async_client(cls) -> None:
+        """Create the pooled async client; call from the app's startup hook."""
+        if cls._async_http is None:
+            cls._async_http = httpx.AsyncClient(**_HTTP_OPTIONS)
+
+    @classmethod
+    async def close_async_client(cls) -> None:
+        """Close the pooled async client; call from the app's shutdown hook."""
+        client, cls._async_http = cls._async_http, None
+        if client is not None:
+            await client.aclose()
 
     @classmethod
     def refresh_profile(cls, name: str) -> Optional[AuthorityProfile]:
@@ -120,8 +236,13 @@ class AuthorityFetcher:
         key = name.strip().upper()
         with cls._lock:
             cls._cache.pop(key, None)
+            cls._negative_cache.pop(key, None)
         return cls.get_profile(key)
 
     @classmethod
     def seeded_names(cls) -> List[str]:
         return list(cls._seeded.keys())
+
+    @classmethod
+    def seeded_profiles(cls) -> List[AuthorityProfile]:
+        return list(cls._seeded.values())
@@ -4,12 +4,22 @@ Supports 13 scam categories, keyword analysis, and rule-based validation.
 """
 
 import re
-from typing import Tuple, Optional, Dict, List
+from functools import lru_cache
+from typing import Any, Tuple, Optional, Dict, List, Set, FrozenSet, NamedTuple, TypedDict
+
+import ahocorasick  # type: ignore[import-not-found]
+
+from .authority_fetcher import AuthorityFetcher, AuthorityProfile
+
+
+class ScamCategory(TypedDict):
+    keywords: List[str]
+    score: int
+    patterns: List[str]
 
-from .authority_fetcher import AuthorityFetcher
 
 # Bank rules - what legitimate banks never ask for
-BANK_RULES = {
+BANK_RULES: Dict[str, Dict[str, List[str]]] = {
     "SBI": {
         "never_asks": ["OTP", "PIN", "CVV", "password", "secret code"],
         "never_requests": ["UPI collect", "remote access", "teamviewer", "anydesk"]
@@ -33,7 +43,7 @@ BANK_RULES = {
 }
 
 # Government rules - what authorities never ask for
-GOVT_RULES = {
+GOVT_RULES: Dict[str, Dict[str, List[str]]] = {
     "POLICE": {
         "never": ["arrest threats on call", "UPI fine payment", "send money immediately"],
         "never_asks": ["OTP", "bank account"]
@@ -49,7 +59,7 @@ GOVT_RULES = {
 }
 
 # Scam category keywords mapping
-SCAM_KEYWORDS = {
+SCAM_KEYWORDS: Dict[str, ScamCategory] = {
     "Bank / KYC / OTP Scam": {
         "keywords": ["otp", "pin", "cvv", "kyc", "verification", "blocked", "suspended", "account will be locked", "confirm identity"],
         "score": 50,
@@ -117,185 +127,379 @@ SCAM_KEYWORDS = {
     }
 }
 
+# Precompiled category tables: (category, base score, keywords, keyword set, compiled patterns)
+_COMPILED_SCAM: List[Tuple[str, int, Tuple[str, ...], FrozenSet[str], Tuple[re.Pattern, ...]]] = [
+    (category, details["score"], tuple(details["keywords"]), frozenset(details["keywords"]),
+     tuple(re.compile(p) for p in details["patterns"]))
+    for category, details in SCAM_KEYWORDS.items()
+]
+
+# Intelligence extraction patterns
+# Phone numbers (10-digit Indian) are the 10-digit runs of _DIGIT_RUN_RE, so
+# both phones and accounts come out of the same scan.
+_UPI_RE = re.compile(r"[\w.\-]+@[a-zA-Z]+")    # UPI IDs (simple pattern)
+_LINK_RE = re.compile(r"https?://[^\s]+")      # Phishing links
+_DIGIT_RUN_RE = re.compile(r"\b\d{10,16}\b")  # Bank accounts (rough: 10-16 digits)
+
+
+# Rule tables with every literal lowercased once at import time. Forbidden
+# literals are frozensets so each rule is a single isdisjoint() check against
+# the literals found in the text.
+_BANK_RULES_LC = {
+    bank.lower(): {
+        "never_asks": frozenset(forbidden.lower() for forbidden in rules["never_asks"]),
+        "never_requests": frozenset(forbidden.lower() for forbidden in rules["never_requests"]),
+    }
+    for bank, rules in BANK_RULES.items()
+}
 
-class ScamDetector:
-    """PRD-compliant scam detection engine."""
+_GOVT_RULES_LC = {
+    authority: {
+        "keywords": frozenset(authority.lower().split("_")),
+        "never": frozenset(forbidden.lower() for forbidden in rules.get("never", [])),
+        "never_asks": frozenset(forbidden.lower() for forbidden in rules.get("never_asks", [])),
+    }
+    for authority, rules in GOVT_RULES.items()
+}
 
-    @staticmethod
-    def detect(text: str) -> Tuple[bool, Optional[str], int, Dict[str, List[str]]]:
-        """
-        Detect scam intent, classify type, calculate confidence, extract intelligence.
-
-        Args:
-            text: Incoming message text
-
-        Returns:
-            (scamDetected, scamType, scamScore, extractedIntelligence)
-        """
-        text_lower = text.lower()
-        score = 0
-        scam_type = None
-        intel = {
-            "upiIds": [],
-            "phoneNumbers": [],
-            "phishingLinks": [],
-            "bankAccounts": [],
-            "suspiciousKeywords": [],
-            "authorityProfile": None
+
+def _build_authority_priority() -> Tuple[Tuple[str, str], ...]:
+    """
+    Ordered (lowercase literal, authority name) pairs; the first pair whose literal
+    appears in a message is the claimed authority.
+    Order: BANK_RULES, then GOVT_RULES (spaced and underscored forms), then seeded profiles.
+    """
+    names: List[Tuple[str, str]] = []
+    for bank in BANK_RULES:
+        names.append((bank.lower(), bank))
+    for auth in GOVT_RULES:
+        names.append((auth.lower().replace("_", " "), auth))
+        names.append((auth.lower(), auth))
+    for name in AuthorityFetcher.seeded_names():
+        names.append((name.lower(), name))
+
+    # Keep the first occurrence of each literal
+    priority: Dict[str, str] = {}
+    for literal, name in names:
+        priority.setdefault(literal, name)
+    return tuple(priority.items())
+
+
+_AUTHORITY_PRIORITY = _build_authority_priority()
+
+
+def _build_literal_automaton() -> ahocorasick.Automaton:
+    """
+    Build one Aho-Corasick automaton over every literal the detector looks for:
+    category keywords, rule trigger words, forbidden rule phrases and authority names.
+    A single pass over the text then yields the set of literals present.
+    """
+    literals: Set[str] = set()
+    for _, _, keywords, _, _ in _COMPILED_SCAM:
+        literals.update(keywords)
+
+    literals.add("bank")
+    for bank, rules in _BANK_RULES_LC.items():
+        literals.add(bank)
+        literals.update(rules["never_asks"])
+        literals.update(rules["never_requests"])
+
+    for rules in _GOVT_RULES_LC.values():
+        literals.update(rules["keywords"])
+        literals.update(rules["never"])
+        literals.update(rules["never_asks"])
+
+    literals.update(literal for literal, _ in _AUTHORITY_PRIORITY)
+
+    for profile in AuthorityFetcher.seeded_profiles():
+        literals.update(profile.never_asks)
+        literals.update(profile.never_requests)
+
+    automaton = ahocorasick.Automaton()
+    for literal in literals:
+        automaton.add_word(literal, literal)
+    automaton.make_automaton()
+    return automaton
+
+
+_LITERAL_AUTOMATON = _build_literal_automaton()
+
+# Signals that need no automaton literal: every category pattern plus a 10-digit
+# run (phones/accounts). Together with '@' and '://' checks on the original text,
+# a message matching none of these and no literal yields an empty analysis.
+_PREFILTER_RE = re.compile("|".join(
+    [p.pattern for _, _, _, _, patterns in _COMPILED_SCAM for p in patterns] + [r"\d{10}"]
+))
+
+
+class _Analysis(NamedTuple):
+    """Immutable, cacheable result of the text-only part of detection."""
+    scam_type: Optional[str]
+    score: int
+    claimed_authority: Optional[str]
+    upi_ids: Tuple[str, ...]
+    phone_numbers: Tuple[str, ...]
+    phishing_links: Tuple[str, ...]
+    bank_accounts: Tuple[str, ...]
+    suspicious_keywords: Tuple[str, ...]
+    found: FrozenSet[str]
+
+
+_EMPTY_ANALYSIS = _Analysis(
+    scam_type=None,
+    score=0,
+    claimed_authority=None,
+    upi_ids=(),
+    phone_numbers=(),
+    phishing_links=(),
+    bank_accounts=(),
+    suspicious_keywords=(),
+    found=frozenset(),
+)
+
+# Shared result for messages with nothing to report. The fields are tuples so
+# no caller can append into it; orjson serializes them as arrays all the same.
+_EMPTY_INTEL: Dict[str, Any] = {
+    "upiIds": (),
+    "phoneNumbers": (),
+    "phishingLinks": (),
+    "bankAccounts": (),
+    "suspiciousKeywords": (),
+    "authorityProfile": None
+}
+
+
+def detect(text: str) -> Tuple[bool, Optional[str], int, Dict[str, Any]]:
+    """
+    Detect scam intent, classify type, calculate confidence, extract intelligence.
+
+    The text-only analysis is memoised per message (bulk scam templates repeat
+    verbatim); the authority profile lookup runs on every call so cached
+    results never outlive the profile TTL.
+
+    Args:
+        text: Incoming message text
+
+    Returns:
+        (scamDetected, scamType, scamScore, extractedIntelligence)
+        extractedIntelligence is read-only: benign messages share one instance.
+    """
+    analysis = _analyze_text(text)
+    claimed = analysis.claimed_authority
+    profile = AuthorityFetcher.get_profile(claimed) if claimed else None
+    return _build_result(text, analysis, profile)
+
+
+async def detect_async(text: str) -> Tuple[bool, Optional[str], int, Dict[str, Any]]:
+    """
+    Same as detect, but resolves the claimed authority profile with
+    AuthorityFetcher.get_profile_async so a discovery miss never blocks the event loop.
+    """
+    analysis = _analyze_text(text)
+    claimed = analysis.claimed_authority
+    profile = await AuthorityFetcher.get_profile_async(claimed) if claimed else None
+    return _build_result(text, analysis, profile)
+
+
+def _build_result(text: str, analysis: _Analysis, profile: Optional[AuthorityProfile]) -> Tuple[bool, Optional[str], int, Dict[str, Any]]:
+    """Combine the cached text analysis with the claimed authority's profile."""
+    if analysis is _EMPTY_ANALYSIS:
+        return False, None, 0, _EMPTY_INTEL
+
+    score = analysis.score
+    intel: Dict[str, Any] = {
+        "upiIds": list(analysis.upi_ids),
+        "phoneNumbers": list(analysis.phone_numbers),
+        "phishingLinks": list(analysis.phishing_links),
+        "bankAccounts": list(analysis.bank_accounts),
+        "suspiciousKeywords": list(analysis.suspicious_keywords),
+        "authorityProfile": None
+    }
+
+    # Step 3: Authority-aware rule validation (Phase 1.5)
+    if profile:
+        intel["authorityProfile"] = {
+            "name": profile.name,
+            "type": profile.type,
+            "official_domains": profile.official_domains,
+            "official_channels": profile.official_channels,
+            "never_asks": profile.never_asks,
+            "never_requests": profile.never_requests,
+            "last_refreshed": profile.last_refreshed,
         }
 
-        # Step 1: Category matching and keyword scoring
-        category_scores = {}
-        for category, details in SCAM_KEYWORDS.items():
-            cat_score = 0
-            matched_keywords = []
+        # Apply dynamic profile-based rule validation
+        score = _apply_profile_validation(text, analysis.found, score, profile)
+
+    # Determine if scam detected (threshold: 35 or higher)
+    scam_detected = score >= 35
+    return scam_detected, analysis.scam_type if scam_detected else None, score, intel
+
+
+def _analyze(text: str) -> _Analysis:
+    """Run keyword scoring, static rule validation and intelligence extraction."""
+    text_lower: str = text.lower()
+    scam_type: Optional[str] = None
+    suspicious_keywords: List[str] = []
+
+    # Single pass over the text collecting every known literal it contains
+    found: Set[str] = {literal for _, literal in _LITERAL_AUTOMATON.iter(text_lower)}
+
+    # Benign messages: nothing can score or be extracted, skip the rest
+    if not found and "@" not in text and "://" not in text and not _PREFILTER_RE.search(text_lower):
+        return _EMPTY_ANALYSIS
 
-            # Keyword matching
-            for keyword in details["keywords"]:
-                if keyword in text_lower:
+    # Step 1: Category matching and keyword scoring
+    # The highest scoring category is tracked as we go (first one wins ties)
+    best_score: int = 0
+    for category, base_score, keywords, keyword_set, patterns in _COMPILED_SCAM:
+        cat_score: int = 0
+        matched_keywords: List[str] = []
+
+        # Keyword matching (most categories have no hit; skip their loop in C)
+        if not found.isdisjoint(keyword_set):
+            for keyword in keywords:
+                if keyword in found:
                     cat_score += 10
                     matched_keywords.append(keyword)
 
-            # Pattern matching
-            for pattern in details.get("patterns", []):
-                if re.search(pattern, text_lower):
-                    cat_score += 15
-
-            if cat_score > 0:
-                cat_score += details["score"]
-                category_scores[category] = cat_score
-
-            if matched_keywords and cat_score > 0:
-                intel["suspiciousKeywords"].extend(matched_keywords[:3])
-
-        # Select highest scoring category
-        if category_scores:
-            scam_type = max(category_scores, key=category_scores.get)
-            score = min(100, category_scores[scam_type])
-
-        # Step 2: Extract intelligence
-        ScamDetector._extract_intelligence(text, intel)
-
-        # Step 3: Authority-aware rule validation (Phase 1.5)
-        # Extract claimed authority (lightweight keyword match) and fetch profile
-        claimed = ScamDetector._extract_claimed_authority(text_lower)
-        if claimed:
-            profile = AuthorityFetcher.get_profile(claimed)
-            if profile:
-                intel["authorityProfile"] = {
-                    "name": profile.name,
-                    "type": profile.type,
-                    "official_domains": profile.official_domains,
-                    "official_channels": profile.official_channels,
-                    "never_asks": profile.never_asks,
-                    "never_requests": profile.never_requests,
-                    "last_refreshed": profile.last_refreshed,
-                }
-
-        # Apply rule validation (uses both static rules and dynamic profile)
-        score = ScamDetector._apply_rule_validation(text_lower, scam_type, score, claimed)
-
-        # Determine if scam detected (threshold: 35 or higher)
-        scam_detected = score >= 35
-        return scam_detected, scam_type if scam_detected else None, score, intel
+        # Pattern matching
+        for pattern in patterns:
+            if pattern.search(text_lower):
+                cat_score += 15
 
-    @staticmethod
-    def _extract_intelligence(text: str, intel: Dict[str, List[str]]) -> None:
-        """Extract UPI IDs, phone numbers, links, bank accounts from text."""
-        # UPI IDs (simple pattern)
-        upi_pattern = r"[\w.\-]+@[a-zA-Z]+"
-        upi_matches = re.findall(upi_pattern, text)
-        intel["upiIds"].extend(list(set(upi_matches))[:5])
-
-        # Phone numbers (10-digit Indian)
-        phone_pattern = r"\b\d{10}\b"
-        phone_matches = re.findall(phone_pattern, text)
-        intel["phoneNumbers"].extend(list(set(phone_matches))[:5])
-
-        # Phishing links
-        link_pattern = r"https?://[^\s]+"
-        link_matches = re.findall(link_pattern, text)
-        intel["phishingLinks"].extend(list(set(link_matches))[:5])
-
-        # Bank account numbers (rough pattern: 10-16 digits)
-        account_pattern = r"\b\d{10,16}\b"
-        account_matches = re.findall(account_pattern, text)
-        intel["bankAccounts"].extend(list(set(account_matches))[:5])
+        if cat_score > 0:
+            cat_score += base_score
+            if cat_score > best_score:
+                best_score, scam_type = cat_score, category
+
+        if matched_keywords and cat_score > 0:
+            suspicious_keywords.extend(matched_keywords[:3])
+
+    # Score of the highest scoring category
+    score: int = min(100, best_score)
+
+    # Step 2: Extract intelligence
+    upi_ids, phone_numbers, phishing_links, bank_accounts = _extract_intelligence(text)
+
+    # Apply static bank/government rule validation
+    score = _apply_rule_validation(found, scam_type, score)
+
+    # Claimed authority: the highest-priority authority named in the text
+    claimed = next((name for literal, name in _AUTHORITY_PRIORITY if literal in found), None)
+
+    return _Analysis(
+        scam_type=scam_type,
+        score=score,
+        claimed_authority=claimed,
+        upi_ids=upi_ids,
+        phone_numbers=phone_numbers,
+        phishing_links=phishing_links,
+        bank_accounts=bank_accounts,
+        suspicious_keywords=tuple(suspicious_keywords),
+        found=frozenset(found),
+    )
+
+
+# Bulk SMS blasts replay identical templates; memoise the text-only analysis.
+# Only SMS-sized texts are cached so large bodies cannot pin memory.
+_MAX_CACHED_TEXT_LENGTH = 2048
+
+
+@lru_cache(maxsize=4096)
+def _analyze_cached(text: str) -> _Analysis:
+    return _analyze(text)
+
+
+def _analyze_text(text: str) -> _Analysis:
+    if len(text) <= _MAX_CACHED_TEXT_LENGTH:
+        return _analyze_cached(text)
+    return _analyze(text)
+
+
+def _extract_intelligence(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Extract UPI IDs, phone numbers, links, bank accounts from text.
+
+    Returns:
+        (upiIds, phoneNumbers, phishingLinks, bankAccounts), at most 5 unique each
+    """
+    # UPI IDs (the regex tries every word character; skip it when there is no '@')
+    upi_ids = tuple(dict.fromkeys(_UPI_RE.findall(text)))[:5] if "@" in text else ()
+
+    # Bank account numbers and phone numbers (10-digit runs)
+    digit_runs = _DIGIT_RUN_RE.findall(text)
+    phone_numbers = tuple(dict.fromkeys(run for run in digit_runs if len(run) == 10))[:5]
+    bank_accounts = tuple(dict.fromkeys(digit_runs))[:5]
+
+    # Phishing links
+    phishing_links = tuple(dict.fromkeys(_LINK_RE.findall(text)))[:5] if "://" in text else ()
+
+    return upi_ids, phone_numbers, phishing_links, bank_accounts
+
+
+def _apply_rule_validation(found: Set[str], scam_type: Optional[str], base_score: int) -> int:
+    """
+    Apply bank/government rule validation to boost scam score if violations detected.
+    Rule literals are looked up in `found`, the literals collected by the
+    automaton pass in `_analyze`.
+    """
+    score = base_score
+
+    # Check for bank rule violations
+    for bank, rules in _BANK_RULES_LC.items():
+        if bank in found or "bank" in found:
+            if not found.isdisjoint(rules["never_asks"]):
+                score += 30
+            if not found.isdisjoint(rules["never_requests"]):
+                score += 25
+
+    # Check for government rule violations
+    for rules in _GOVT_RULES_LC.values():
+        if not found.isdisjoint(rules["keywords"]):
+            if not found.isdisjoint(rules["never"]):
+                score += 40
+            if not found.isdisjoint(rules["never_asks"]):
+                score += 30
+
+    return min(100, score)
+
+
+def _apply_profile_validation(text: str, found: FrozenSet[str], base_score: int, profile: AuthorityProfile) -> int:
+    """
+    Apply dynamic profile-based checks (Phase 1.5) for the claimed authority's profile.
+    """
+    score = base_score
+
+    # check never_asks and never_requests from dynamic profile
+    for forbidden in profile.never_asks:
+        if _text_contains(text, found, forbidden):
+            score += 30
+            break
+
+    for forbidden in profile.never_requests:
+        if _text_contains(text, found, forbidden):
+            score += 25
+            break
+
+    return min(100, score)
+
+
+def _text_contains(text: str, found: FrozenSet[str], literal: str) -> bool:
+    """Whether the lowercased text contains literal, answered from the automaton pass when possible."""
+    if literal in _LITERAL_AUTOMATON:
+        return literal in found
+    # Only profiles discovered at runtime can carry literals the automaton lacks
+    return literal in text.lower()
+
+
+class ScamDetector:
+    """PRD-compliant scam detection engine (kept for existing call sites)."""
 
     @staticmethod
-    def _apply_rule_validation(text_lower: str, scam_type: Optional[str], base_score: int, claimed_authority: Optional[str] = None) -> int:
-        """
-        Apply bank/government rule validation to boost scam score if violations detected.
-        """
-        score = base_score
-
-        # Check for bank rule violations
-        for bank, rules in BANK_RULES.items():
-            if bank.lower() in text_lower or "bank" in text_lower:
-                for forbidden in rules["never_asks"]:
-                    if forbidden.lower() in text_lower:
-                        score += 30
-                        break
-
-                for forbidden in rules["never_requests"]:
-                    if forbidden.lower() in text_lower:
-                        score += 25
-                        break
-
-        # Check for government rule violations
-        for authority, rules in GOVT_RULES.items():
-            auth_keywords = authority.lower().split("_")
-            if any(kw in text_lower for kw in auth_keywords):
-                for forbidden in rules.get("never", []):
-                    if forbidden.lower() in text_lower:
-                        score += 40
-                        break
-
-                for forbidden in rules.get("never_asks", []):
-                    if forbidden.lower() in text_lower:
-                        score += 30
-                        break
-
-        # Dynamic profile-based checks (Phase 1.5)
-        if claimed_authority:
-            profile = AuthorityFetcher.get_profile(claimed_authority)
-            if profile:
-                # check never_asks and never_requests from dynamic profile
-                for forbidden in profile.never_asks:
-                    if forbidden.lower() in text_lower:
-                        score += 30
-                        break
-
-                for forbidden in profile.never_requests:
-                    if forbidden.lower() in text_lower:
-                        score += 25
-                        break
-
-        return min(100, score)
+    def detect(text: str) -> Tuple[bool, Optional[str], int, Dict[str, Any]]:
+        return detect(text)
 
     @staticmethod
-    def _extract_claimed_authority(text_lower: str) -> Optional[str]:
-        """Lightweight extraction of claimed authority from message text."""
-        # Check known bank keys
-        candidates = []
-        for bank in BANK_RULES.keys():
-            if bank.lower() in text_lower:
-                candidates.append(bank)
-
-        # Check known govt keys
-        for auth in GOVT_RULES.keys():
-            if auth.lower().replace("_", " ") in text_lower or auth.lower() in text_lower:
-                candidates.append(auth)
-
-        # Check seeded authority fetcher names as fallback
-        try:
-            for name in AuthorityFetcher.seeded_names():
-                if name.lower() in text_lower and name not in candidates:
-                    candidates.append(name)
-        except Exception:
-            pass
-
-        if candidates:
-            # Prefer the first candidate
-            return candidates[0]
-        return None
+    async def detect_async(text: str) -> Tuple[bool, Optional[str], int, Dict[str, Any]]:
+        return await detect_async(text)
@@ -13,3 +13,64 @@ for m in msgs:
     print(f" Detected: {detected}, Type: {scam_type}, Score: {score}")
     print(f" Authority Profile: {intel.get('authorityProfile')}")
     print()
+
+# Cache behaviour, with discovery stubbed out so no network is needed
+import time
+from unittest import mock
+from app.services.authority_fetcher import AuthorityFetcher, AuthorityProfile
+
+probes = []
+
+
+def answered_404(key):
+    probes.append(key)
+    return None, True
+
+
+def unreachable(key):
+    probes.append(key)
+    return None, False
+
+
+def found(key):
+    probes.append(key)
+    return AuthorityProfile(key, "BANK", [f"{key.lower()}.com"], ["WEBSITE"], ["otp"], []), True
+
+
+with mock.patch.object(AuthorityFetcher, "_discover_profile", answered_404):
+    # Negative-cache hit: the second lookup is not re-probed
+    assert AuthorityFetcher.get_profile("NOSUCHBANK") is None
+    assert AuthorityFetcher.get_profile("NOSUCHBANK") is None
+    assert probes == ["NOSUCHBANK"]
+
+    # Negative-cache expiry: a stale miss is probed again
+    AuthorityFetcher._negative_cache["NOSUCHBANK"] -= AuthorityFetcher._negative_ttl_seconds + 1
+    assert AuthorityFetcher.get_profile("NOSUCHBANK") is None
+    assert probes == ["NOSUCHBANK", "NOSUCHBANK"]
+
+with mock.patch.object(AuthorityFetcher, "_discover_profile", unreachable):
+    # Probes that never got a response are not remembered as misses
+    assert AuthorityFetcher.get_profile("OFFLINEBANK") is None
+    assert "OFFLINEBANK" not in AuthorityFetcher._negative_cache
+
+with mock.patch.object(AuthorityFetcher, "_discover_profile", found):
+    profile = AuthorityFetcher.get_profile("ACMEBANK")
+    assert profile.official_domains == ["acmebank.com"]
+    assert AuthorityFetcher.get_profile("ACMEBANK") is profile
+    # refresh_profile clears both caches: a negative entry is dropped and re-probed
+    AuthorityFetcher._negative_cache["ACMEBANK"] = time.time()
+    probes.clear()
+    assert AuthorityFetcher.refresh_profile("ACMEBANK") is not profile
+    assert probes == ["ACMEBANK"]
+    assert "ACMEBANK" not in AuthorityFetcher._negative_cache
+
+with mock.patch.object(AuthorityFetcher, "_discover_profile", answered_404):
+    assert AuthorityFetcher.refresh_profile("ACMEBANK") is None
+    assert "ACMEBANK" not in AuthorityFetcher._cache
+    assert "ACMEBANK" in AuthorityFetcher._negative_cache
+
+# Seeded profiles are copied into the cache, never stamped in place
+assert AuthorityFetcher.get_profile("SBI").last_refreshed > 0
+assert AuthorityFetcher._seeded["SBI"].last_refreshed == 0.0
+
+print("Authority cache checks passed")
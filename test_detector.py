@@ -15,3 +15,18 @@ for msg in test_msgs:
     print(f"  Detected: {detected} | Type: {scam_type} | Score: {score}")
     if intel['upiIds'] or intel['phoneNumbers'] or intel['phishingLinks']:
         print(f"  Intel: {intel}")
+
+# The async entry point must agree with the sync one
+import asyncio
+
+for msg in test_msgs:
+    assert asyncio.run(ScamDetector.detect_async(msg)) == ScamDetector.detect(msg), msg
+
+# Benign text short-circuits to the shared, read-only empty intelligence dict
+from app.services.scam_detector import _EMPTY_INTEL
+
+assert ScamDetector.detect('Normal message, how are you?') == (False, None, 0, _EMPTY_INTEL)
+assert ScamDetector.detect('Normal message, how are you?')[3] is _EMPTY_INTEL
+assert all(isinstance(v, tuple) for k, v in _EMPTY_INTEL.items() if k != "authorityProfile")
+
+print("\nAsync and benign-text checks passed")